@@ -1,55 +1,181 @@
-import json
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
+import orjson
 import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeElapsedColumn
 from rich.table import Table
 
-from .config import DEFAULT_MODEL, DEFAULT_FORMAT
+from .config import DEFAULT_MODEL, DEFAULT_FORMAT, OUTPUT_BUFFER_SIZE, RELEASE_MEMORY_EVERY
 from .scanner import scan_directory, compute_output_path
 from .tracker import Tracker
-from .transcriber import transcribe_file
-from .vocabulary import load_vocabulary, build_initial_prompt, apply_replacements
+from .transcriber import load_model, prefetch_audio, release_memory, transcribe_file
+from .vocabulary import (
+    CompiledReplacements,
+    load_compiled_vocabulary,
+    apply_replacements_many,
+)
 
 app = typer.Typer(help="Batch transcribe audio/video files using mlx-whisper.")
 console = Console()
 err_console = Console(stderr=True)
 
 
+def make_progress() -> Progress:
+    """Build the batch progress display.
+
+    Redraws twice a second. When stdout is not a terminal the spinner and
+    bar are dropped, since Rich only renders the final state there anyway.
+    """
+    if console.is_terminal:
+        columns = [
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            TimeElapsedColumn(),
+        ]
+    else:
+        columns = [
+            TextColumn("[progress.description]{task.description}"),
+            TaskProgressColumn(),
+            TimeElapsedColumn(),
+        ]
+    return Progress(*columns, console=console, refresh_per_second=2)
+
+
+def project_segments(segments: list[dict]) -> list[dict]:
+    """Keep only start/end/text from mlx_whisper segments for JSON output."""
+    return [{"start": s["start"], "end": s["end"], "text": s["text"]} for s in segments]
+
+
 def write_output(result: dict, output_path: Path, fmt: str) -> None:
     """Write transcription result to file(s)."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     if fmt in ("txt", "both"):
         txt_path = output_path.with_suffix(".txt")
-        txt_path.write_text(result["text"].strip() + "\n")
+        with open(txt_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+            f.write(result["text"].strip().encode())
+            f.write(b"\n")
 
     if fmt in ("json", "both"):
         json_path = output_path.with_suffix(".json")
         output = {
             "file": output_path.stem,
             "text": result["text"],
-            "segments": [
-                {"start": s["start"], "end": s["end"], "text": s["text"]}
-                for s in result.get("segments", [])
-            ],
+            "segments": project_segments(result.get("segments", [])),
         }
-        json_path.write_text(json.dumps(output, indent=2, ensure_ascii=False) + "\n")
+        with open(json_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+            f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+            f.write(b"\n")
 
 
-def apply_vocab_replacements(result: dict, vocab: dict | None) -> dict:
+def apply_vocab_replacements(result: dict, replacements: CompiledReplacements | None) -> dict:
     """Apply vocabulary replacements to transcription result text and segments."""
-    if not vocab:
+    if not replacements:
         return result
-    result["text"] = apply_replacements(result["text"], vocab)
-    for segment in result.get("segments", []):
-        segment["text"] = apply_replacements(segment["text"], vocab)
+    segments = result.get("segments", [])
+    texts = apply_replacements_many([result["text"], *(s["text"] for s in segments)], replacements)
+    result["text"] = texts[0]
+    for segment, text in zip(segments, texts[1:]):
+        segment["text"] = text
     return result
 
 
+def record_write(
+    tracker: Tracker,
+    input_path: str,
+    write: Future,
+    duration: float | None,
+    elapsed: float,
+    failed_label: str,
+) -> None:
+    """Mark a file completed once its output is written, or failed if the write raised."""
+    try:
+        write.result()
+    except Exception as e:
+        tracker.mark_failed(input_path, str(e))
+        console.print(f"[red]{failed_label}: {Path(input_path).name} — {e}[/red]")
+    else:
+        tracker.mark_completed(input_path, duration_seconds=duration, processing_seconds=elapsed)
+
+
+def transcribe_batch(
+    tracker: Tracker,
+    jobs: list[tuple[str, Path, str, str]],
+    label: str,
+    failed_label: str,
+    language: str | None,
+    initial_prompt: str | None,
+    replacements: CompiledReplacements | None,
+) -> None:
+    """Transcribe (input_path, output_path, format, model) jobs and record results.
+
+    The next file is decoded while the current one transcribes, and each
+    transcript is written on a background thread while the next file starts.
+    A file is marked processing (and committed) before it is transcribed, and
+    only marked completed once its output is on disk.
+    """
+    try:
+        load_model(jobs[0][3])
+    except Exception as e:
+        # Not fatal: each file then fails and is recorded on its own
+        console.print(f"[red]Could not load model {jobs[0][3]}: {e}[/red]")
+    in_flight = None
+
+    with make_progress() as progress, ThreadPoolExecutor(max_workers=1) as writer:
+        task = progress.add_task(label, total=len(jobs))
+        decoded = prefetch_audio(input_path for input_path, _, _, _ in jobs)
+        try:
+            for i, ((input_path, out_path, fmt, model), audio) in enumerate(zip(jobs, decoded), 1):
+                name = Path(input_path).name
+                progress.update(task, description=f"[cyan]{name}[/cyan]")
+                if not console.is_terminal:
+                    console.print(f"[{i}/{len(jobs)}] {name}", markup=False)
+
+                # Settle the previous file now if its write already finished
+                with tracker.conn:
+                    if in_flight and in_flight[1].done():
+                        record_write(tracker, *in_flight, failed_label)
+                        in_flight = None
+                    tracker.mark_processing(input_path)
+
+                error = None
+                try:
+                    start = time.time()
+                    result = transcribe_file(audio.result(), model=model, language=language, initial_prompt=initial_prompt)
+                    elapsed = time.time() - start
+
+                    apply_vocab_replacements(result, replacements)
+                    duration = result.get("duration") or result.get("segments", [{}])[-1].get("end")
+                    write = writer.submit(write_output, result, out_path, fmt)
+                except Exception as e:
+                    error = e
+
+                with tracker.conn:
+                    if in_flight:
+                        record_write(tracker, *in_flight, failed_label)
+                        in_flight = None
+                    if error:
+                        tracker.mark_failed(input_path, str(error))
+                        console.print(f"[red]{failed_label}: {name} — {error}[/red]")
+                if not error:
+                    in_flight = (input_path, write, duration, elapsed)
+
+                progress.advance(task)
+                if i % RELEASE_MEMORY_EVERY == 0:
+                    release_memory()
+        finally:
+            # Also runs on Ctrl-C so an already-written transcript is not redone
+            if in_flight:
+                with tracker.conn:
+                    record_write(tracker, *in_flight, failed_label)
+
+
 @app.command()
 def run(
     input_dir: Path = typer.Argument(..., help="Directory containing audio/video files"),
@@ -73,66 +199,37 @@ def run(
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    vocabulary = load_vocabulary(vocab_path=vocab, output_dir=output_dir)
-    initial_prompt = build_initial_prompt(vocabulary)
+    initial_prompt, replacements = load_compiled_vocabulary(vocab_path=vocab, output_dir=output_dir)
 
-    files = scan_directory(scan_dir)
-    if not files:
+    # Output paths are computed as the scan yields each file
+    pairs = [(f, compute_output_path(f, input_dir, output_dir, format)) for f in scan_directory(scan_dir)]
+    if not pairs:
         console.print("[yellow]No supported audio/video files found.[/yellow]")
         raise typer.Exit(0)
 
     tracker = Tracker(output_dir)
 
     # Register all files in tracker
-    for f in files:
-        out_path = compute_output_path(f, input_dir, output_dir, format)
-        tracker.add_file(str(f), str(out_path), model)
+    tracker.add_files([(str(f), str(out_path), model) for f, out_path in pairs])
 
     # Determine which files to process
     to_process = []
-    for f in files:
+    for f, out_path in pairs:
         status = tracker.get_status(str(f))
         if overwrite or status != "completed":
-            to_process.append(f)
+            to_process.append((f, out_path))
 
     if not to_process:
         console.print("[green]All files already transcribed.[/green]")
         tracker.close()
         raise typer.Exit(0)
 
-    console.print(f"Processing {len(to_process)} of {len(files)} files with model [bold]{model}[/bold]")
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        TimeElapsedColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Transcribing", total=len(to_process))
-
-        for f in to_process:
-            progress.update(task, description=f"[cyan]{f.name}[/cyan]")
-            out_path = compute_output_path(f, input_dir, output_dir, format)
-            tracker.mark_processing(str(f))
-
-            try:
-                start = time.time()
-                result = transcribe_file(str(f), model=model, language=language, initial_prompt=initial_prompt)
-                elapsed = time.time() - start
+    console.print(f"Processing {len(to_process)} of {len(pairs)} files with model [bold]{model}[/bold]")
 
-                apply_vocab_replacements(result, vocabulary)
-                write_output(result, out_path, format)
-
-                duration = result.get("duration") or result.get("segments", [{}])[-1].get("end")
-                tracker.mark_completed(str(f), duration_seconds=duration, processing_seconds=elapsed)
-            except Exception as e:
-                tracker.mark_failed(str(f), str(e))
-                console.print(f"[red]Failed: {f.name} — {e}[/red]")
-
-            progress.advance(task)
+    jobs = [(str(f), out_path, format, model) for f, out_path in to_process]
+    transcribe_batch(tracker, jobs, "Transcribing", "Failed", language, initial_prompt, replacements)
 
+    tracker.checkpoint()
     tracker.close()
     console.print("[green]Done![/green]")
 
@@ -152,8 +249,7 @@ def single(
         console.print(f"[red]File not found: {file_path}[/red]")
         raise typer.Exit(1)
 
-    vocabulary = load_vocabulary(vocab_path=vocab)
-    initial_prompt = build_initial_prompt(vocabulary)
+    initial_prompt, replacements = load_compiled_vocabulary(vocab_path=vocab)
 
     err_console.print(f"Transcribing [bold]{file_path.name}[/bold] with model [bold]{model}[/bold]...")
 
@@ -161,7 +257,7 @@ def single(
     result = transcribe_file(str(file_path), model=model, language=language, initial_prompt=initial_prompt)
     elapsed = time.time() - start
 
-    apply_vocab_replacements(result, vocabulary)
+    apply_vocab_replacements(result, replacements)
     duration = result.get("duration")
 
     if output:
@@ -172,12 +268,9 @@ def single(
             out = {
                 "file": file_path.name,
                 "text": result["text"],
-                "segments": [
-                    {"start": s["start"], "end": s["end"], "text": s["text"]}
-                    for s in result.get("segments", [])
-                ],
+                "segments": project_segments(result.get("segments", [])),
             }
-            print(json.dumps(out, indent=2, ensure_ascii=False))
+            print(orjson.dumps(out, option=orjson.OPT_INDENT_2).decode())
         else:
             print(result["text"].strip())
 
@@ -192,7 +285,7 @@ def status(
 ):
     """Show progress for a batch job."""
     output_dir = output_dir.resolve()
-    tracker = Tracker(output_dir)
+    tracker = Tracker(output_dir, read_only=True)
     summary = tracker.get_summary()
 
     if summary["total"] == 0:
@@ -239,8 +332,7 @@ def retry(
     """Retry all failed files."""
     output_dir = output_dir.resolve()
 
-    vocabulary = load_vocabulary(vocab_path=vocab, output_dir=output_dir)
-    initial_prompt = build_initial_prompt(vocabulary)
+    initial_prompt, replacements = load_compiled_vocabulary(vocab_path=vocab, output_dir=output_dir)
 
     tracker = Tracker(output_dir)
 
@@ -253,39 +345,13 @@ def retry(
     console.print(f"Retrying {count} failed files...")
 
     pending = tracker.get_pending_files()
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        TimeElapsedColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Retrying", total=len(pending))
-
-        for row in pending:
-            input_path = row["input_path"]
-            out_path = Path(row["output_path"])
-            file_model = model or row["model"]
-            progress.update(task, description=f"[cyan]{Path(input_path).name}[/cyan]")
-            tracker.mark_processing(input_path)
-
-            try:
-                start = time.time()
-                result = transcribe_file(input_path, model=file_model, initial_prompt=initial_prompt)
-                elapsed = time.time() - start
-
-                apply_vocab_replacements(result, vocabulary)
-                write_output(result, out_path, out_path.suffix.lstrip(".") or "txt")
-
-                duration = result.get("duration") or result.get("segments", [{}])[-1].get("end")
-                tracker.mark_completed(input_path, duration_seconds=duration, processing_seconds=elapsed)
-            except Exception as e:
-                tracker.mark_failed(input_path, str(e))
-                console.print(f"[red]Failed again: {Path(input_path).name} — {e}[/red]")
-
-            progress.advance(task)
+    jobs = []
+    for row in pending:
+        out_path = Path(row["output_path"])
+        jobs.append((row["input_path"], out_path, out_path.suffix.lstrip(".") or "txt", model or row["model"]))
+    transcribe_batch(tracker, jobs, "Retrying", "Failed again", None, initial_prompt, replacements)
 
+    tracker.checkpoint()
     tracker.close()
     console.print("[green]Retry complete![/green]")
 
@@ -295,11 +361,13 @@ def list_files(
     output_dir: Path = typer.Argument(..., help="Output directory with tracker DB"),
     status_filter: str = typer.Option(None, "--status", help="Filter by status: pending, processing, completed, failed"),
     sort: str = typer.Option("name", help="Sort by: name, status, duration"),
+    limit: int = typer.Option(None, help="Show at most this many files"),
+    offset: int = typer.Option(0, help="Skip this many files before listing"),
 ):
     """List all tracked files and their statuses."""
     output_dir = output_dir.resolve()
-    tracker = Tracker(output_dir)
-    files = tracker.get_all_files(status=status_filter, sort=sort)
+    tracker = Tracker(output_dir, read_only=True)
+    files = tracker.get_all_files(status=status_filter, sort=sort, limit=limit, offset=offset)
 
     if not files:
         console.print("[yellow]No files found.[/yellow]")
@@ -1,10 +1,20 @@
+from itertools import product
+
 DEFAULT_MODEL = "mlx-community/whisper-large-v3-turbo"
 DEFAULT_FORMAT = "txt"
 DEFAULT_WORKERS = 1
+OUTPUT_BUFFER_SIZE = 1 << 20
+RELEASE_MEMORY_EVERY = 16
 
 AUDIO_EXTENSIONS = {".mp3", ".wav", ".m4a", ".flac", ".ogg", ".aac", ".wma"}
 VIDEO_EXTENSIONS = {".mp4", ".mkv", ".mov", ".avi", ".webm"}
 SUPPORTED_EXTENSIONS = AUDIO_EXTENSIONS | VIDEO_EXTENSIONS
+# Every upper/lower-case spelling of each extension, for str.endswith
+SUPPORTED_SUFFIX_TUPLE = tuple(
+    "".join(chars)
+    for ext in sorted(SUPPORTED_EXTENSIONS)
+    for chars in product(*(dict.fromkeys((c.lower(), c.upper())) for c in ext))
+)
 
 TRACKER_DIR = ".transcribe-cli"
 TRACKER_DB = "jobs.db"
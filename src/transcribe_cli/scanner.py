@@ -1,15 +1,32 @@
+import os
+from collections.abc import Iterator
 from pathlib import Path
 
-from .config import SUPPORTED_EXTENSIONS
+from .config import SUPPORTED_SUFFIX_TUPLE
 
 
-def scan_directory(input_dir: Path) -> list[Path]:
-    """Recursively scan input_dir for supported audio/video files."""
-    files = []
-    for path in sorted(input_dir.rglob("*")):
-        if path.is_file() and path.suffix.lower() in SUPPORTED_EXTENSIONS:
-            files.append(path)
-    return files
+def scan_directory(input_dir: Path) -> Iterator[Path]:
+    """Recursively yield supported audio/video files under input_dir, in sorted order.
+
+    Uses os.scandir so the file/directory checks come from the directory
+    entry itself rather than an extra stat per path. Each directory is
+    sorted by entry name on its own, which gives the same order as sorting
+    the full paths without collecting the whole tree first.
+    """
+    yield from _scan(str(input_dir))
+
+
+def _scan(directory: str) -> Iterator[Path]:
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return  # unreadable directory; skipped like Path.rglob does
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scan(entry.path)
+        elif entry.name.endswith(SUPPORTED_SUFFIX_TUPLE, 1) and entry.is_file():
+            yield Path(entry.path)
 
 
 def compute_output_path(
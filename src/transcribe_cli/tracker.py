@@ -3,6 +3,10 @@ from pathlib import Path
 
 from .config import TRACKER_DIR, TRACKER_DB
 
+PAGE_SIZE = 8192
+MMAP_SIZE = 256 * 1024 * 1024
+CACHE_SIZE_KIB = 64 * 1024
+
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS files (
     id INTEGER PRIMARY KEY,
@@ -16,17 +20,37 @@ CREATE TABLE IF NOT EXISTS files (
     created_at TEXT DEFAULT (datetime('now')),
     completed_at TEXT
 );
+CREATE INDEX IF NOT EXISTS idx_files_status ON files(status);
+CREATE INDEX IF NOT EXISTS idx_files_duration ON files(duration_seconds);
 """
 
 
 class Tracker:
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, read_only: bool = False):
         db_dir = output_dir / TRACKER_DIR
-        db_dir.mkdir(parents=True, exist_ok=True)
         self.db_path = db_dir / TRACKER_DB
-        self.conn = sqlite3.connect(str(self.db_path))
+        # Read-only opens skip locking and schema setup; a missing DB is
+        # still created so callers see an empty tracker as before.
+        read_only = read_only and self.db_path.is_file()
+        if read_only:
+            uri = self.db_path.resolve().as_uri() + "?mode=ro"
+            self.conn = sqlite3.connect(uri, uri=True)
+        else:
+            db_dir.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(self.db_path))
         self.conn.row_factory = sqlite3.Row
-        self.conn.execute(SCHEMA)
+        self.conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        self.conn.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KIB}")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        if read_only:
+            return
+        # page_size only applies to a fresh DB and must precede WAL mode
+        self.conn.execute(f"PRAGMA page_size={PAGE_SIZE}")
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # Leave the WAL in place on close; run/retry fold it back via checkpoint()
+        self.conn.setconfig(sqlite3.SQLITE_DBCONFIG_NO_CKPT_ON_CLOSE, True)
+        self.conn.executescript(SCHEMA)
         self.conn.commit()
 
     def add_file(self, input_path: str, output_path: str, model: str) -> None:
@@ -36,6 +60,13 @@ class Tracker:
         )
         self.conn.commit()
 
+    def add_files(self, rows: list[tuple[str, str, str]]) -> None:
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO files (input_path, output_path, model) VALUES (?, ?, ?)",
+                rows,
+            )
+
     def get_status(self, input_path: str) -> str | None:
         row = self.conn.execute(
             "SELECT status FROM files WHERE input_path = ?", (input_path,)
@@ -47,7 +78,6 @@ class Tracker:
             "UPDATE files SET status = 'processing' WHERE input_path = ?",
             (input_path,),
         )
-        self.conn.commit()
 
     def mark_completed(
         self,
@@ -61,14 +91,12 @@ class Tracker:
                WHERE input_path = ?""",
             (duration_seconds, processing_seconds, input_path),
         )
-        self.conn.commit()
 
     def mark_failed(self, input_path: str, error: str) -> None:
         self.conn.execute(
             "UPDATE files SET status = 'failed', error = ? WHERE input_path = ?",
             (error, input_path),
         )
-        self.conn.commit()
 
     def get_pending_files(self) -> list[sqlite3.Row]:
         return self.conn.execute(
@@ -88,35 +116,27 @@ class Tracker:
         return cursor.rowcount
 
     def get_summary(self) -> dict:
-        rows = self.conn.execute(
-            """SELECT status, COUNT(*) as count,
-                      SUM(duration_seconds) as total_duration,
-                      SUM(processing_seconds) as total_processing
-               FROM files GROUP BY status"""
-        ).fetchall()
-        summary = {
-            "total": 0,
-            "pending": 0,
-            "processing": 0,
-            "completed": 0,
-            "failed": 0,
-            "total_duration": 0.0,
-            "total_processing": 0.0,
-        }
-        for row in rows:
-            summary[row["status"]] = row["count"]
-            summary["total"] += row["count"]
-            if row["total_duration"]:
-                summary["total_duration"] += row["total_duration"]
-            if row["total_processing"]:
-                summary["total_processing"] += row["total_processing"]
-        return summary
+        row = self.conn.execute(
+            """SELECT COUNT(*) AS total,
+                      COALESCE(SUM(status = 'pending'), 0) AS pending,
+                      COALESCE(SUM(status = 'processing'), 0) AS processing,
+                      COALESCE(SUM(status = 'completed'), 0) AS completed,
+                      COALESCE(SUM(status = 'failed'), 0) AS failed,
+                      COALESCE(SUM(duration_seconds), 0.0) AS total_duration,
+                      COALESCE(SUM(processing_seconds), 0.0) AS total_processing
+               FROM files"""
+        ).fetchone()
+        return dict(row)
 
     def get_all_files(
-        self, status: str | None = None, sort: str = "name"
+        self,
+        status: str | None = None,
+        sort: str = "name",
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[sqlite3.Row]:
         query = "SELECT * FROM files"
-        params: list[str] = []
+        params: list[str | int] = []
         if status:
             query += " WHERE status = ?"
             params.append(status)
@@ -126,7 +146,16 @@ class Tracker:
             "duration": "duration_seconds",
         }.get(sort, "input_path")
         query += f" ORDER BY {sort_col}"
+        if limit is not None or offset:
+            # SQLite needs a LIMIT before OFFSET; -1 means no limit
+            query += " LIMIT ? OFFSET ?"
+            params.extend([-1 if limit is None else limit, offset])
         return self.conn.execute(query, params).fetchall()
 
+    def checkpoint(self) -> None:
+        self.conn.commit()
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
     def close(self) -> None:
+        self.conn.commit()
         self.conn.close()
@@ -1,18 +1,74 @@
 import gc
+import subprocess
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import mlx.core as mx
 import mlx_whisper
+import numpy as np
+from mlx_whisper.audio import SAMPLE_RATE
+from mlx_whisper.transcribe import ModelHolder
 
 from .config import DEFAULT_MODEL
 
 
+def load_model(model: str = DEFAULT_MODEL) -> None:
+    """Load model weights before the first file so they are not timed with it.
+
+    mlx_whisper keeps the last used model in ModelHolder and reuses it across
+    transcribe() calls, so loading it once here covers the whole batch.
+    """
+    ModelHolder.get_model(model, mx.float16)
+
+
+def release_memory() -> None:
+    """Run a full GC pass and return MLX's cached Metal buffers to the system."""
+    gc.collect()
+    mx.clear_cache()
+
+
+def load_audio(file_path: str) -> np.ndarray:
+    """Decode an audio/video file to mono float32 samples at Whisper's sample rate.
+
+    Mirrors mlx_whisper.audio.load_audio but stays in NumPy, so it is safe to
+    call from a worker thread and hand the result to mlx_whisper later.
+    """
+    cmd = [
+        "ffmpeg", "-nostdin", "-i", file_path,
+        "-threads", "0", "-f", "s16le", "-ac", "1",
+        "-acodec", "pcm_s16le", "-ar", str(SAMPLE_RATE), "-",
+    ]
+    try:
+        out = subprocess.run(cmd, capture_output=True, check=True).stdout
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Failed to load audio: {e.stderr.decode()}") from e
+    return np.frombuffer(out, np.int16).astype(np.float32) / 32768.0
+
+
+def prefetch_audio(file_paths: Iterable[str]) -> Iterator[Future]:
+    """Yield a decode future per path, keeping one file decoding ahead.
+
+    While the caller transcribes one file, the next is decoded on a worker
+    thread, so at most two decoded files are held in memory at once.
+    """
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = None
+        for path in file_paths:
+            future = pool.submit(load_audio, path)
+            if pending is not None:
+                yield pending
+            pending = future
+        if pending is not None:
+            yield pending
+
+
 def transcribe_file(
-    file_path: str,
+    audio: str | np.ndarray,
     model: str = DEFAULT_MODEL,
     language: str | None = None,
     initial_prompt: str | None = None,
 ) -> dict:
-    """Transcribe a single audio/video file using mlx-whisper.
+    """Transcribe a single audio/video file (or pre-decoded samples) using mlx-whisper.
 
     Returns the full mlx_whisper result dict with 'text' and 'segments'.
     """
@@ -24,9 +80,4 @@ def transcribe_file(
     if initial_prompt:
         kwargs["initial_prompt"] = initial_prompt
 
-    result = mlx_whisper.transcribe(file_path, **kwargs)
-
-    gc.collect()
-    mx.clear_cache()
-
-    return result
+    return mlx_whisper.transcribe(audio, **kwargs)
@@ -1,31 +1,64 @@
 import json
+import re
 from pathlib import Path
+from typing import NamedTuple
 
 from .config import TRACKER_DIR, VOCABULARY_FILE
 
 
-def load_vocabulary(
+# Joins texts for a single replacement pass; never produced by Whisper
+_SEPARATOR = "\x1e"
+
+
+class CompiledReplacements(NamedTuple):
+    pattern: re.Pattern[str]
+    mapping: dict[str, str]
+
+
+class CompiledVocabulary(NamedTuple):
+    initial_prompt: str | None
+    replacements: CompiledReplacements | None
+
+
+def find_vocabulary(
     vocab_path: Path | None = None,
     output_dir: Path | None = None,
-) -> dict | None:
-    """Load vocabulary from explicit path or auto-discover from output_dir.
-
-    Returns the parsed dict or None if no vocabulary file is found.
-    """
+) -> Path | None:
+    """Resolve the vocabulary file from explicit path or output_dir auto-discovery."""
     if vocab_path:
         path = vocab_path.resolve()
-        if not path.is_file():
-            return None
-        return json.loads(path.read_text())
+        return path if path.is_file() else None
 
     if output_dir:
         path = output_dir / TRACKER_DIR / VOCABULARY_FILE
         if path.is_file():
-            return json.loads(path.read_text())
+            return path
 
     return None
 
 
+def load_vocabulary(
+    vocab_path: Path | None = None,
+    output_dir: Path | None = None,
+) -> dict | None:
+    """Load vocabulary from explicit path or auto-discover from output_dir.
+
+    Returns the parsed dict or None if no vocabulary file is found.
+    """
+    path = find_vocabulary(vocab_path, output_dir)
+    if path is None:
+        return None
+    return json.loads(path.read_text())
+
+
+def load_compiled_vocabulary(
+    vocab_path: Path | None = None,
+    output_dir: Path | None = None,
+) -> CompiledVocabulary:
+    """Load a vocabulary file and return its initial prompt and compiled replacements."""
+    return compile_vocabulary(load_vocabulary(vocab_path, output_dir))
+
+
 def build_initial_prompt(vocab: dict | None) -> str | None:
     """Join vocabulary list into a comma-separated initial_prompt string."""
     if not vocab:
@@ -36,11 +69,51 @@ def build_initial_prompt(vocab: dict | None) -> str | None:
     return ", ".join(terms)
 
 
-def apply_replacements(text: str, vocab: dict | None) -> str:
-    """Apply case-sensitive find-and-replace from vocabulary replacements."""
+def compile_replacements(vocab: dict | None) -> CompiledReplacements | None:
+    """Compile vocabulary replacements into a single regex alternation.
+
+    Keys are tried longest-first so a longer phrase wins over any key it
+    contains. Returns None if there is nothing to replace.
+    """
     if not vocab:
+        return None
+    mapping = vocab.get("replacements", {})
+    if not mapping:
+        return None
+    keys = sorted((k for k in mapping if k), key=len, reverse=True)
+    if not keys:
+        return None
+    pattern = re.compile("|".join(re.escape(k) for k in keys))
+    return CompiledReplacements(pattern, mapping)
+
+
+def compile_vocabulary(vocab: dict | None) -> CompiledVocabulary:
+    """Build the initial prompt and compiled replacements for a vocabulary dict."""
+    return CompiledVocabulary(build_initial_prompt(vocab), compile_replacements(vocab))
+
+
+def apply_replacements(text: str, compiled: CompiledReplacements | None) -> str:
+    """Apply case-sensitive find-and-replace in a single pass over text."""
+    if not compiled:
         return text
-    replacements = vocab.get("replacements", {})
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-    return text
+    mapping = compiled.mapping
+    return compiled.pattern.sub(lambda m: mapping[m.group(0)], text)
+
+
+def apply_replacements_many(
+    texts: list[str], compiled: CompiledReplacements | None
+) -> list[str]:
+    """Apply replacements to many texts with one regex pass over all of them.
+
+    The texts are joined on a record separator, rewritten together and split
+    back apart. Falls back to one pass per text if the separator could be
+    matched or produced, or already appears in the input.
+    """
+    if not compiled or not texts:
+        return texts
+    blob = _SEPARATOR.join(texts)
+    if blob.count(_SEPARATOR) != len(texts) - 1 or any(
+        _SEPARATOR in k or _SEPARATOR in v for k, v in compiled.mapping.items()
+    ):
+        return [apply_replacements(text, compiled) for text in texts]
+    return apply_replacements(blob, compiled).split(_SEPARATOR)
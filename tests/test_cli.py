@@ -0,0 +1,174 @@
+import sys
+import threading
+import types
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+
+try:
+    import mlx_whisper  # noqa: F401
+except ImportError:
+    # mlx only installs on Apple silicon; register empty stand-ins so the CLI imports
+    for name in ("mlx", "mlx.core", "mlx_whisper", "mlx_whisper.audio", "mlx_whisper.transcribe"):
+        sys.modules[name] = types.ModuleType(name)
+    sys.modules["mlx"].core = sys.modules["mlx.core"]
+    sys.modules["mlx_whisper.audio"].SAMPLE_RATE = 16000
+    sys.modules["mlx_whisper.transcribe"].ModelHolder = None
+
+from transcribe_cli import cli
+from transcribe_cli.tracker import Tracker
+from transcribe_cli.vocabulary import compile_replacements
+
+
+def done_future(value):
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+def test_apply_vocab_replacements_text_and_segments():
+    compiled = compile_replacements({"replacements": {"Oram": "Orem"}})
+    result = {"text": " in Oram. Then Oram.", "segments": [{"text": " in Oram."}, {"text": " Then Oram."}]}
+
+    cli.apply_vocab_replacements(result, compiled)
+
+    assert [s["text"] for s in result["segments"]] == [" in Orem.", " Then Orem."]
+    assert result["text"] == " in Orem. Then Orem."
+
+
+def test_apply_vocab_replacements_fixes_key_across_segments():
+    compiled = compile_replacements({"replacements": {"Steak Center": "Stake Center"}})
+    result = {"text": " at the Steak Center.", "segments": [{"text": " at the Steak"}, {"text": " Center."}]}
+
+    cli.apply_vocab_replacements(result, compiled)
+
+    assert result["text"] == " at the Stake Center."
+    assert [s["text"] for s in result["segments"]] == [" at the Steak", " Center."]
+
+
+def test_apply_vocab_replacements_without_segments():
+    compiled = compile_replacements({"replacements": {"Steak Center": "Stake Center"}})
+    result = cli.apply_vocab_replacements({"text": " at the Steak Center."}, compiled)
+    assert result["text"] == " at the Stake Center."
+
+
+@pytest.fixture
+def batch(tmp_path, monkeypatch):
+    """Run transcribe_batch over files a, b, c with mlx replaced by a fake transcribe."""
+    monkeypatch.setattr(cli, "load_model", lambda model: None)
+    monkeypatch.setattr(cli, "release_memory", lambda: None)
+    monkeypatch.setattr(cli, "prefetch_audio", lambda paths: (done_future(path) for path in paths))
+
+    tracker = Tracker(tmp_path)
+    jobs = [(f"/in/{name}.mp3", tmp_path / "out" / f"{name}.txt", "txt", "model") for name in "abc"]
+    tracker.add_files([(input_path, str(out_path), "model") for input_path, out_path, _, _ in jobs])
+    seen = {}
+
+    def committed_statuses():
+        reader = Tracker(tmp_path, read_only=True)
+        statuses = {row["input_path"]: row["status"] for row in reader.get_all_files()}
+        reader.close()
+        return statuses
+
+    def run(transcribe=None):
+        def fake_transcribe(audio, model, language, initial_prompt):
+            seen[audio] = committed_statuses()
+            if transcribe:
+                transcribe(audio)
+            return {"text": f"text of {Path(audio).stem}", "segments": [{"start": 0.0, "end": 1.0, "text": "x"}]}
+
+        monkeypatch.setattr(cli, "transcribe_file", fake_transcribe)
+        try:
+            cli.transcribe_batch(tracker, jobs, "Transcribing", "Failed", None, None, None)
+        finally:
+            tracker.close()
+        return committed_statuses()
+
+    run.seen = seen
+    run.jobs = jobs
+    return run
+
+
+def test_transcribe_batch_marks_processing_before_transcribing(batch):
+    statuses = batch()
+
+    for input_path, out_path, _, _ in batch.jobs:
+        assert batch.seen[input_path][input_path] == "processing"
+        assert out_path.read_text() == f"text of {Path(input_path).stem}\n"
+    assert batch.seen["/in/a.mp3"]["/in/b.mp3"] == "pending"
+    assert set(statuses.values()) == {"completed"}
+
+
+def test_transcribe_batch_completes_only_after_write(batch, monkeypatch):
+    written = threading.Event()
+    write_output = cli.write_output
+
+    def slow_write(result, output_path, fmt):
+        if output_path.stem == "a":
+            assert written.wait(5)
+        write_output(result, output_path, fmt)
+
+    def transcribe(audio):
+        if audio == "/in/b.mp3":
+            written.set()
+
+    monkeypatch.setattr(cli, "write_output", slow_write)
+    statuses = batch(transcribe)
+
+    # a's write was still blocked when b started, so a was not yet completed
+    assert batch.seen["/in/b.mp3"]["/in/a.mp3"] == "processing"
+    assert batch.seen["/in/c.mp3"]["/in/a.mp3"] == "completed"
+    assert set(statuses.values()) == {"completed"}
+
+
+def test_transcribe_batch_transcribe_failure(batch):
+    def transcribe(audio):
+        if audio == "/in/b.mp3":
+            raise RuntimeError("decoder blew up")
+
+    statuses = batch(transcribe)
+
+    assert batch.seen["/in/c.mp3"]["/in/b.mp3"] == "failed"
+    assert statuses == {"/in/a.mp3": "completed", "/in/b.mp3": "failed", "/in/c.mp3": "completed"}
+
+
+def test_transcribe_batch_write_failure(batch, monkeypatch):
+    write_output = cli.write_output
+
+    def failing_write(result, output_path, fmt):
+        if output_path.stem == "b":
+            raise OSError("disk full")
+        write_output(result, output_path, fmt)
+
+    monkeypatch.setattr(cli, "write_output", failing_write)
+    statuses = batch()
+
+    assert statuses == {"/in/a.mp3": "completed", "/in/b.mp3": "failed", "/in/c.mp3": "completed"}
+
+
+def test_transcribe_batch_interrupt_keeps_finished_work(batch):
+    def transcribe(audio):
+        if audio == "/in/b.mp3":
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        batch(transcribe)
+
+    reader = Tracker(batch.jobs[0][1].parent.parent, read_only=True)
+    statuses = {row["input_path"]: row["status"] for row in reader.get_all_files()}
+    reader.close()
+    assert statuses == {"/in/a.mp3": "completed", "/in/b.mp3": "processing", "/in/c.mp3": "pending"}
+
+
+def test_transcribe_batch_model_load_failure_marks_files_failed(batch, monkeypatch):
+    def load_model(model):
+        raise OSError("offline")
+
+    def transcribe(audio):
+        raise OSError("offline")
+
+    monkeypatch.setattr(cli, "load_model", load_model)
+    statuses = batch(transcribe)
+
+    assert statuses == {"/in/a.mp3": "failed", "/in/b.mp3": "failed", "/in/c.mp3": "failed"}
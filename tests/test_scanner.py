@@ -0,0 +1,83 @@
+import os
+from pathlib import Path
+
+from transcribe_cli.scanner import scan_directory, compute_output_path
+
+
+def test_scan_directory_finds_nested_media(tmp_path):
+    (tmp_path / "b").mkdir()
+    (tmp_path / "a.mp3").touch()
+    (tmp_path / "b" / "c.wav").touch()
+    (tmp_path / "notes.txt").touch()
+
+    result = list(scan_directory(tmp_path))
+    assert result == [tmp_path / "a.mp3", tmp_path / "b" / "c.wav"]
+
+
+def test_scan_directory_case_insensitive(tmp_path):
+    (tmp_path / "loud.MP3").touch()
+    (tmp_path / "mixed.Mp4").touch()
+
+    result = list(scan_directory(tmp_path))
+    assert result == [tmp_path / "loud.MP3", tmp_path / "mixed.Mp4"]
+
+
+def test_scan_directory_skips_bare_extension_dotfile(tmp_path):
+    # Path(".mp3").suffix is empty, so a file named just ".mp3" is not media
+    (tmp_path / ".mp3").touch()
+    (tmp_path / "a.mp3").touch()
+
+    result = list(scan_directory(tmp_path))
+    assert result == [tmp_path / "a.mp3"]
+
+
+def test_scan_directory_sorted_like_paths(tmp_path):
+    (tmp_path / "b").mkdir()
+    (tmp_path / "b" / "z.mp3").touch()
+    (tmp_path / "b.mp3").touch()
+    (tmp_path / "a.mp3").touch()
+
+    result = list(scan_directory(tmp_path))
+    assert result == sorted(result)
+    assert result == [tmp_path / "a.mp3", tmp_path / "b" / "z.mp3", tmp_path / "b.mp3"]
+
+
+def test_scan_directory_skips_directories_with_media_names(tmp_path):
+    (tmp_path / "album.mp3").mkdir()
+    (tmp_path / "album.mp3" / "track.flac").touch()
+
+    result = list(scan_directory(tmp_path))
+    assert result == [tmp_path / "album.mp3" / "track.flac"]
+
+
+def test_compute_output_path_mirrors_structure():
+    result = compute_output_path(Path("/in/podcast/ep01.mp3"), Path("/in"), Path("/out"), "txt")
+    assert result == Path("/out/podcast/ep01.txt")
+
+
+def test_compute_output_path_json():
+    result = compute_output_path(Path("/in/ep01.mp3"), Path("/in"), Path("/out"), "json")
+    assert result == Path("/out/ep01.json")
+
+
+def test_scan_directory_is_lazy(tmp_path):
+    (tmp_path / "a.mp3").touch()
+    files = scan_directory(tmp_path)
+    assert next(files) == tmp_path / "a.mp3"
+    assert next(files, None) is None
+
+
+def test_scan_directory_skips_unreadable_directory(tmp_path, monkeypatch):
+    (tmp_path / "locked").mkdir()
+    (tmp_path / "locked" / "hidden.mp3").touch()
+    (tmp_path / "open.mp3").touch()
+    scandir = os.scandir
+
+    def guarded_scandir(path):
+        if path == str(tmp_path / "locked"):
+            raise PermissionError(13, "Permission denied", path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", guarded_scandir)
+    result = list(scan_directory(tmp_path))
+    assert result == [tmp_path / "open.mp3"]
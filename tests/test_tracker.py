@@ -0,0 +1,141 @@
+import sqlite3
+
+import pytest
+
+from transcribe_cli.tracker import Tracker
+
+
+def test_add_files_registers_rows(tmp_path):
+    tracker = Tracker(tmp_path)
+    tracker.add_files([
+        ("/in/a.mp3", "/out/a.txt", "model"),
+        ("/in/b.mp3", "/out/b.txt", "model"),
+    ])
+    assert tracker.get_status("/in/a.mp3") == "pending"
+    assert tracker.get_status("/in/b.mp3") == "pending"
+    tracker.close()
+
+
+def test_add_files_ignores_duplicates(tmp_path):
+    tracker = Tracker(tmp_path)
+    tracker.add_files([("/in/a.mp3", "/out/a.txt", "model")])
+    with tracker.conn:
+        tracker.mark_completed("/in/a.mp3", duration_seconds=1.0, processing_seconds=0.5)
+    tracker.add_files([("/in/a.mp3", "/out/a.txt", "model")])
+    assert tracker.get_status("/in/a.mp3") == "completed"
+    tracker.close()
+
+
+def test_wal_mode_enabled(tmp_path):
+    tracker = Tracker(tmp_path)
+    mode = tracker.conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+    tracker.close()
+
+
+def test_status_updates_persist_after_close(tmp_path):
+    tracker = Tracker(tmp_path)
+    tracker.add_files([("/in/a.mp3", "/out/a.txt", "model")])
+    tracker.mark_processing("/in/a.mp3")
+    tracker.mark_failed("/in/a.mp3", "boom")
+    tracker.close()
+
+    reopened = Tracker(tmp_path)
+    assert reopened.get_status("/in/a.mp3") == "failed"
+    assert reopened.get_failed_files()[0]["error"] == "boom"
+    reopened.close()
+
+
+def test_status_queries_use_index(tmp_path):
+    tracker = Tracker(tmp_path)
+    plan = tracker.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM files WHERE status = 'failed'"
+    ).fetchall()
+    assert any("idx_files_status" in row["detail"] for row in plan)
+    tracker.close()
+
+
+def test_fresh_db_uses_larger_pages(tmp_path):
+    tracker = Tracker(tmp_path)
+    assert tracker.conn.execute("PRAGMA page_size").fetchone()[0] == 8192
+    tracker.close()
+
+
+def test_read_only_tracker_reads_existing_db(tmp_path):
+    tracker = Tracker(tmp_path)
+    tracker.add_files([("/in/a.mp3", "/out/a.txt", "model")])
+    tracker.close()
+
+    reader = Tracker(tmp_path, read_only=True)
+    assert reader.get_status("/in/a.mp3") == "pending"
+    with pytest.raises(sqlite3.OperationalError):
+        reader.mark_processing("/in/a.mp3")
+    reader.close()
+
+
+def test_read_only_tracker_without_db(tmp_path):
+    reader = Tracker(tmp_path, read_only=True)
+    assert reader.get_summary()["total"] == 0
+    reader.close()
+
+
+def test_get_summary_counts_and_totals(tmp_path):
+    tracker = Tracker(tmp_path)
+    tracker.add_files([(f"/in/{name}.mp3", f"/out/{name}.txt", "model") for name in "abcd"])
+    tracker.mark_completed("/in/a.mp3", duration_seconds=60.0, processing_seconds=2.0)
+    tracker.mark_completed("/in/b.mp3", duration_seconds=30.0, processing_seconds=1.0)
+    tracker.mark_failed("/in/c.mp3", "boom")
+    tracker.close()
+
+    reader = Tracker(tmp_path, read_only=True)
+    assert reader.get_summary() == {
+        "total": 4,
+        "pending": 1,
+        "processing": 0,
+        "completed": 2,
+        "failed": 1,
+        "total_duration": 90.0,
+        "total_processing": 3.0,
+    }
+    reader.close()
+
+
+def test_get_summary_empty(tmp_path):
+    tracker = Tracker(tmp_path)
+    assert tracker.get_summary() == {
+        "total": 0,
+        "pending": 0,
+        "processing": 0,
+        "completed": 0,
+        "failed": 0,
+        "total_duration": 0.0,
+        "total_processing": 0.0,
+    }
+    tracker.close()
+
+
+def test_get_all_files_limit_offset(tmp_path):
+    tracker = Tracker(tmp_path)
+    tracker.add_files([(f"/in/{name}.mp3", f"/out/{name}.txt", "model") for name in "abcde"])
+
+    def names(rows):
+        return [row["input_path"] for row in rows]
+
+    assert names(tracker.get_all_files(limit=2)) == ["/in/a.mp3", "/in/b.mp3"]
+    assert names(tracker.get_all_files(limit=2, offset=2)) == ["/in/c.mp3", "/in/d.mp3"]
+    assert names(tracker.get_all_files(offset=3)) == ["/in/d.mp3", "/in/e.mp3"]
+    tracker.close()
+
+
+def test_close_keeps_wal_until_checkpoint(tmp_path):
+    tracker = Tracker(tmp_path)
+    tracker.add_files([("/in/a.mp3", "/out/a.txt", "model")])
+    tracker.close()
+    wal = tracker.db_path.with_name(tracker.db_path.name + "-wal")
+    assert wal.stat().st_size > 0
+
+    tracker = Tracker(tmp_path)
+    tracker.checkpoint()
+    assert wal.stat().st_size == 0
+    assert tracker.get_status("/in/a.mp3") == "pending"
+    tracker.close()
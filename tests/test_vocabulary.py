@@ -1,7 +1,14 @@
 import json
 from pathlib import Path
 
-from transcribe_cli.vocabulary import load_vocabulary, build_initial_prompt, apply_replacements
+from transcribe_cli.vocabulary import (
+    load_vocabulary,
+    build_initial_prompt,
+    compile_replacements,
+    apply_replacements,
+    apply_replacements_many,
+    load_compiled_vocabulary,
+)
 
 
 def test_load_vocabulary_explicit_path(tmp_path):
@@ -69,34 +76,119 @@ def test_build_initial_prompt_none():
 
 def test_apply_replacements_basic():
     vocab = {"replacements": {"Steak Center": "Stake Center"}}
-    result = apply_replacements("We met at the Steak Center today.", vocab)
+    result = apply_replacements("We met at the Steak Center today.", compile_replacements(vocab))
     assert result == "We met at the Stake Center today."
 
 
 def test_apply_replacements_multiple():
     vocab = {"replacements": {"Oram": "Orem", "Mount Tupinogos": "Mount Timpanogos"}}
-    result = apply_replacements("Oram is near Mount Tupinogos.", vocab)
+    result = apply_replacements("Oram is near Mount Tupinogos.", compile_replacements(vocab))
     assert result == "Orem is near Mount Timpanogos."
 
 
 def test_apply_replacements_case_sensitive():
     vocab = {"replacements": {"steak": "stake"}}
-    result = apply_replacements("Steak center and steak center.", vocab)
+    result = apply_replacements("Steak center and steak center.", compile_replacements(vocab))
     assert result == "Steak center and stake center."
 
 
 def test_apply_replacements_no_match():
     vocab = {"replacements": {"XYZ": "ABC"}}
-    result = apply_replacements("Nothing to replace here.", vocab)
+    result = apply_replacements("Nothing to replace here.", compile_replacements(vocab))
     assert result == "Nothing to replace here."
 
 
 def test_apply_replacements_none_vocab():
-    result = apply_replacements("Some text.", None)
+    result = apply_replacements("Some text.", compile_replacements(None))
     assert result == "Some text."
 
 
 def test_apply_replacements_no_replacements_key():
     vocab = {"vocabulary": ["Orem"]}
-    result = apply_replacements("Some text.", vocab)
+    result = apply_replacements("Some text.", compile_replacements(vocab))
     assert result == "Some text."
+
+
+def test_apply_replacements_longest_key_wins():
+    vocab = {"replacements": {"Steak": "Stake", "Steak Center": "Stake Center"}}
+    result = apply_replacements("The Steak Center.", compile_replacements(vocab))
+    assert result == "The Stake Center."
+
+
+def test_apply_replacements_escapes_regex_characters():
+    vocab = {"replacements": {"a.m.": "AM", "(sic)": ""}}
+    result = apply_replacements("At 9 a.m. (sic) or 9 aXmX.", compile_replacements(vocab))
+    assert result == "At 9 AM  or 9 aXmX."
+
+
+def test_compile_replacements_empty():
+    assert compile_replacements({"replacements": {}}) is None
+    assert compile_replacements(None) is None
+
+
+def test_apply_replacements_many_matches_per_text():
+    compiled = compile_replacements({"replacements": {"Oram": "Orem", "Steak Center": "Stake Center"}})
+    texts = [" Oram is near", " the Steak Center.", "", " Nothing here."]
+    result = apply_replacements_many(texts, compiled)
+    assert result == [apply_replacements(t, compiled) for t in texts]
+    assert result == [" Orem is near", " the Stake Center.", "", " Nothing here."]
+
+
+def test_apply_replacements_many_does_not_match_across_texts():
+    compiled = compile_replacements({"replacements": {"Steak Center": "Stake Center"}})
+    result = apply_replacements_many(["the Steak", " Center"], compiled)
+    assert result == ["the Steak", " Center"]
+
+
+def test_apply_replacements_many_separator_in_text():
+    compiled = compile_replacements({"replacements": {"Oram": "Orem"}})
+    result = apply_replacements_many(["Oram\x1eOram", "Oram"], compiled)
+    assert result == ["Orem\x1eOrem", "Orem"]
+
+
+def test_apply_replacements_many_separator_in_value():
+    compiled = compile_replacements({"replacements": {"Oram": "Orem\x1e"}})
+    assert apply_replacements_many(["Oram", " ok"], compiled) == ["Orem\x1e", " ok"]
+
+
+def test_apply_replacements_many_none():
+    assert apply_replacements_many(["Oram"], None) == ["Oram"]
+
+
+def test_load_compiled_vocabulary(tmp_path):
+    vocab_file = tmp_path / "vocab.json"
+    vocab_file.write_text(json.dumps({"vocabulary": ["Orem"], "replacements": {"Oram": "Orem"}}))
+
+    initial_prompt, replacements = load_compiled_vocabulary(vocab_path=vocab_file)
+    assert initial_prompt == "Orem"
+    assert apply_replacements("Oram", replacements) == "Orem"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["vocab.json"]
+
+
+def test_load_compiled_vocabulary_missing(tmp_path):
+    result = load_compiled_vocabulary(vocab_path=tmp_path / "nonexistent.json")
+    assert result == (None, None)
+
+
+def test_apply_replacements_single_char_keys():
+    vocab = {"replacements": {"\u2019": "'", "\u201c": '"', "\u201d": '"', "Oram": "Orem"}}
+    result = apply_replacements("Oram\u2019s \u201ccenter\u201d", compile_replacements(vocab))
+    assert result == 'Orem\'s "center"'
+
+
+def test_single_char_key_inside_multi_key():
+    vocab = {"replacements": {"'": "\u2019", "don't": "do not"}}
+    result = apply_replacements("don't say 'no'", compile_replacements(vocab))
+    assert result == "do not say \u2019no\u2019"
+
+
+def test_single_char_replacement_output_is_not_rematched():
+    vocab = {"replacements": {"x": "S", "Steak": "Stake"}}
+    result = apply_replacements("xteak Steak", compile_replacements(vocab))
+    assert result == "Steak Stake"
+
+
+def test_single_char_deletion_does_not_join_matches():
+    vocab = {"replacements": {"Y": "", "be": "BE"}}
+    result = apply_replacements("bYe be", compile_replacements(vocab))
+    assert result == "be BE"